@@ -1,7 +1,9 @@
 """Datastructures and control code for the Toptek controller"""
 
+import errno
+import io
 import logging
-import os
+import select
 import sys
 import time
 from dataclasses import dataclass
@@ -32,108 +34,126 @@ class ToptekSwitches(IntEnum):
     DA_EN = 6
 
 
-@dataclass
+# Encoded form of every fixed command, so that write() doesn't re-encode them on each call
+_CMD_BYTES = {
+    cmd: cmd.encode("ascii")
+    for cmd in (
+        "RA",
+        "RB",
+        "RS",
+        "RW",
+        "RX",
+        "EN",
+        "DS",
+        *(f"{op}{int(switch)}" for op in "RSUPQ" for switch in ToptekSwitches),
+        *(f"M{presses}" for presses in range(1, 10)),
+    )
+}
+
+# Commands that press or set a switch, and so may change the PA state
+_INVALIDATING = "SUPQM"
+
+
+def _encode(cmd: str) -> bytes:
+    """Encode a command for sending, using the pre-encoded form where there is one"""
+    return _CMD_BYTES.get(cmd) or cmd.encode("ascii")
+
+
+# LED bit positions in the shift register word read from the controller
+_MASKS = tuple(1 << k for k in range(12))
+_STATE_MASK = 0x0FFF  # Everything above the LEDs is the keyboard row scan
+_BARGRAPH_MASK = 0x00FF  # LED_10 through LED_80
+
+# Bargraph value indexed by the position of the highest lit LED
+_POWER_TABLE = (0, 10, 20, 30, 40, 50, 60, 70, 80)
+_SWR_TABLE = (1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9)
+
+# Bargraph value for every possible bargraph byte, so decoding is a single index
+_POWER_BY_BARGRAPH = tuple(_POWER_TABLE[leds.bit_length()] for leds in range(256))
+_SWR_BY_BARGRAPH = tuple(_SWR_TABLE[leds.bit_length()] for leds in range(256))
+
+# Error shown by each of the lower LEDs when in red LED mode, starting at LED_10
+_ERR_NAMES = ("PA FAIL", "HIGH TEMP", "DC VOLTAGE", "OVERDRIVE", "HIGH SWR")
+_ERR_MASK = 0b11111
+
+# Switch bit positions in the switch word read from the controller
+_SW_SSB_ON = 0b00010000
+_SW_TX_PA = 0b00100000
+_SW_SET_PWR = 0b00000100
+_SW_RX_LNA = 0b00001000
+_SW_SHOW_SWR = 0b00000001
+
+
+@dataclass(slots=True, frozen=True)
 class ToptekState:
-    """Class to store and translate the state of the LEDs"""
-
-    # pylint: disable=too-many-instance-attributes
-    led_10: bool
-    led_20: bool
-    led_30: bool
-    led_40: bool
-    led_50: bool
-    led_60: bool
-    led_70: bool
-    led_80: bool
-    red_en: bool
-    lna_on: bool
-    tx_pa: bool
-    ssb_on: bool
+    """Class to store and translate the state of the LEDs
+
+    The LEDs are kept as the packed word read from the controller, and exposed as boolean
+        attributes named in LED_BITS
+    """
+
+    _raw: int
     da_swr: bool
 
+    LED_BITS = {
+        "led_10": 0,
+        "led_20": 1,
+        "led_30": 2,
+        "led_40": 3,
+        "led_50": 4,
+        "led_60": 5,
+        "led_70": 6,
+        "led_80": 7,
+        "red_en": 8,
+        "lna_on": 9,
+        "tx_pa": 10,
+        "ssb_on": 11,
+    }
+
+    def __getattr__(self, name: str) -> bool:
+        try:
+            bit = self.LED_BITS[name]
+        except KeyError as err:
+            raise AttributeError(name) from err
+        return bool(self._raw & _MASKS[bit])
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)}" for name in self.LED_BITS)
+        return f"ToptekState({fields}, da_swr={self.da_swr})"
+
     def get_power(self) -> int:
         """Parses LED state and returns the power level"""
-        # pylint: disable=too-many-return-statements
-
         if self.red_en:
             raise ToptekException("Red LEDs are on, unable to get power")
 
-        if self.led_80:
-            return 80
-        if self.led_70:
-            return 70
-        if self.led_60:
-            return 60
-        if self.led_50:
-            return 50
-        if self.led_40:
-            return 40
-        if self.led_30:
-            return 30
-        if self.led_20:
-            return 20
-        if self.led_10:
-            return 10
-        return 0
+        return _POWER_BY_BARGRAPH[self._raw & _BARGRAPH_MASK]
 
     def get_swr(self) -> float:
         """Parses LED state and returns the SWR level"""
-        # pylint: disable=too-many-return-statements
-
-        if self.led_80:
-            return 1.9
-        if self.led_70:
-            return 1.8
-        if self.led_60:
-            return 1.7
-        if self.led_50:
-            return 1.6
-        if self.led_40:
-            return 1.5
-        if self.led_30:
-            return 1.4
-        if self.led_20:
-            return 1.3
-        if self.led_10:
-            return 1.2
-        return 1
+        return _SWR_BY_BARGRAPH[self._raw & _BARGRAPH_MASK]
 
     def get_errors(self) -> list[str]:
         """Parses LED state and returns any errors"""
         if not self.red_en:
             raise ToptekException("No error apparent!")
 
-        errors = []
-
         # In red LED mode, values are inverted
-        if not self.led_10:
-            errors.append("PA FAIL")
-        if not self.led_20:
-            errors.append("HIGH TEMP")
-        if not self.led_30:
-            errors.append("DC VOLTAGE")
-        if not self.led_40:
-            errors.append("OVERDRIVE")
-        if not self.led_50:
-            errors.append("HIGH SWR")
+        err_mask = ~self._raw & _ERR_MASK
+        errors = []
+        # Only visit the set bits, lowest first
+        while err_mask:
+            lowest = err_mask & -err_mask
+            errors.append(_ERR_NAMES[lowest.bit_length() - 1])
+            err_mask ^= lowest
 
         return errors
 
     def any_on(self) -> bool:
         """Helper to check if any of the LEDs are on"""
-        return (
-            self.led_80
-            or self.led_70
-            or self.led_60
-            or self.led_50
-            or self.led_40
-            or self.led_30
-            or self.led_20
-            or self.led_10
-        )
+        return bool(self._raw & _BARGRAPH_MASK)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToptekSwitchState:
     """Class to store the state of the switches"""
 
@@ -150,44 +170,141 @@ class Toptek:
 
     # pylint: disable=too-many-public-methods
 
-    FLASHY_POLL_DELAY = 0.05  # Time between checking state
     FLASHY_TOTAL_DELAY = 2  # Time until PA's bargraph mode turns off
+    STATE_CACHE_TTL = 0.1  # Time a read state can be reused for
+    SERIAL_TIMEOUT = 0.2  # Deadline for a response line; echoes take well under 1 ms
+    WELCOME_TIMEOUT = 2  # Time for the Arduino to boot after the port resets it
+    PRESS_TIME = 0.2  # Time for the controller to deliver a press and let the PA react
+    PRESS_SPACING = 0.2  # Extra time the controller leaves between repeated presses
+    # The controller's busy-wait timeouts run long while its SPI interrupt fires, so allow
+    # this many times the nominal firmware time before giving up on a reply
+    FIRMWARE_TIME_MARGIN = 2
+    PRESS_POLL_DELAY = 0.01  # Time between checking state while waiting on a press
+    LED_OFF_DELAY = 0.5  # Extra time for an LED to go out after its button is pressed
 
     def __init__(self, port: str) -> None:
-        # Ensure we have r/w
         self.port = Path(port)
-        if not self.port.exists():
-            raise FileNotFoundError(self.port)
-
-        if not os.access(self.port, os.R_OK | os.W_OK):
-            logger.critical(
-                "Unable to acquire read/write permissions on %s.\n"
-                + "Please change permissions, or run this script as superuser.",
-                self.port,
+        self._state_cache: tuple[float, ToptekState, ToptekSwitchState] | None = None
+        self._rxbuf = bytearray()  # Received bytes not yet returned by readline()
+
+        # Opening the port doubles as the r/w check; pyserial keeps the errno if it fails
+        try:
+            self.ser = serial.Serial(
+                port,
+                115200,
+                timeout=self.SERIAL_TIMEOUT,
+                write_timeout=self.SERIAL_TIMEOUT,
             )
-            sys.exit(1)
+        except serial.SerialException as err:
+            if err.errno == errno.ENOENT:
+                raise FileNotFoundError(self.port) from err
+            if err.errno == errno.EACCES:
+                logger.critical(
+                    "Unable to acquire read/write permissions on %s.\n"
+                    + "Please change permissions, or run this script as superuser.",
+                    self.port,
+                )
+                sys.exit(1)
+            raise
+
+        # pyserial's Windows backend has no usable fileno() to select() on
+        try:
+            self.ser.fileno()
+        except (io.UnsupportedOperation, OSError):
+            self._selectable = False
+        else:
+            self._selectable = True
+        self._set_low_latency()
+
+        # Opening the port resets the Arduino, which greets us once it has booted
+        deadline = time.monotonic() + self.WELCOME_TIMEOUT
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ToptekException("Invalid welcome message")
+            if self.readline(remaining) == "Toptek Switch Interface":
+                break
 
-        self.ser = serial.Serial(port, 115200, timeout=1)
-        time.sleep(1)
-        if self.readline() != "Toptek Switch Interface":
-            raise ToptekException("Invalid welcome message")
+    def _set_low_latency(self) -> None:
+        """Ask the USB-serial driver to hand over received bytes immediately
+
+        FTDI-style adapters otherwise buffer for up to 16 ms per message. Only supported on Linux,
+            and not by every driver. If it fails here, `setserial /dev/ttyUSB0 low_latency`
+            does the same from a shell.
+        """
+        try:
+            self.ser.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, OSError) as err:
+            logger.debug("Unable to set low latency mode on %s: %s", self.port, err)
+        else:
+            logger.debug("Set low latency mode on %s", self.port)
 
     def write(self, cmd: str) -> None:
         """Write a command over Serial"""
-        logger.debug("TX: %s", cmd)
-        self.ser.write(cmd.encode("ascii"))
-        time.sleep(0.05)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TX: %s", cmd)
+        if cmd[0] in _INVALIDATING:
+            self._state_cache = None
+        self.ser.write(_encode(cmd))
+        self._check_echo(cmd)
+
+    def bulk_write(self, cmds: list[str]) -> None:
+        """Write several commands over Serial at once, then check each of their echoes
+
+        The controller parses commands back to back, so they are sent in a single write.
+            Only the last command may reply with more than its echo; that reply is left for
+            the next readline().
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TX: %s", " ".join(cmds))
+        if any(cmd[0] in _INVALIDATING for cmd in cmds):
+            self._state_cache = None
+        self.ser.write(b"".join(_encode(cmd) for cmd in cmds))
+        for cmd in cmds:
+            self._check_echo(cmd)
+
+    def _check_echo(self, cmd: str) -> None:
+        """Read the controller's echo of a command"""
+        # readline() blocks until the echo arrives, so no need to sleep before this
         ret = self.readline()
-        if ret != f"{cmd}":
+        if ret != cmd:
             raise ToptekException(f"Invalid response from Toptek: {ret}")
 
-    def readline(self) -> str:
-        """Read one line from Serial"""
-        line = self.ser.readline()
-        line_decoded = line.decode("utf-8").strip()
-        logger.debug("RX: %s", line_decoded)
+    def readline(self, timeout: float | None = None) -> str:
+        """Read one line from Serial
+
+        Returns as soon as a newline arrives, or with whatever was received once timeout
+            (SERIAL_TIMEOUT by default) passes. Bytes after the newline are kept for the next call.
+        """
+        if timeout is None:
+            timeout = self.SERIAL_TIMEOUT
+        deadline = time.monotonic() + timeout
+
+        while (end := self._rxbuf.find(b"\n")) < 0:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not (chunk := self._read_available(remaining)):
+                end = len(self._rxbuf) - 1
+                break
+            self._rxbuf += chunk
+
+        # The protocol is plain ASCII, so decode straight out of the buffer
+        line_decoded = self._rxbuf[: end + 1].decode("ascii", errors="replace").strip()
+        del self._rxbuf[: end + 1]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("RX: %s", line_decoded)
         return line_decoded
 
+    def _read_available(self, timeout: float) -> bytes:
+        """Wait up to timeout for data, and return whatever has arrived"""
+        if self._selectable:
+            if not select.select([self.ser], [], [], timeout)[0]:
+                return b""
+            return self.ser.read(self.ser.in_waiting or 1)
+
+        # Without select(), let pyserial do the waiting
+        self.ser.timeout = timeout
+        return self.ser.read_until(b"\n")
+
     def query(self, cmd: str) -> str:
         """Send command and get response"""
         self.write(cmd)
@@ -219,9 +336,32 @@ class Toptek:
         # So that the PA can process the button press
         time.sleep(0.1)
 
+    def _wait_for_led(self, led: str, expected: bool, max_wait: float) -> ToptekState:
+        """Poll the LED state until an LED reads as expected, or max_wait passes"""
+        deadline = time.monotonic() + max_wait
+        while True:
+            state = self.get_state(use_cache=False)
+            if getattr(state, led) == expected or time.monotonic() >= deadline:
+                return state
+            time.sleep(self.PRESS_POLL_DELAY)
+
+    def press_and_read(self, switch: ToptekSwitches) -> ToptekState:
+        """Press a button, and read the LED state once the PA has processed the press
+
+        Replaces a press() followed by get_state() with a single round-trip
+        """
+        self.write(f"Q{int(switch)}")
+        state, _ = self._read_full_state(self.PRESS_TIME)
+        return state
+
     def get_switch(self, switch: ToptekSwitches) -> bool:
         """Get current state of a single button"""
-        return bool(self.query(f"R{int(switch)}"))
+        ret = self.query(f"R{int(switch)}")
+        # The response is "0" or "1", and any non-empty string is truthy
+        try:
+            return bool(int(ret))
+        except ValueError as err:
+            raise ToptekException(f"Invalid switch state from Toptek: {ret!r}") from err
 
     def enable(self) -> None:
         """Enable remote key presses (enabled by default)
@@ -239,44 +379,71 @@ class Toptek:
             raise ToptekException("Failed to disable remote keys")
         logger.info("Disabled remote control of PA")
 
-    def get_state(self) -> ToptekState:
-        """Read the current state of the LEDs"""
-        da_state = int(self.query("RS"))
-        toptek_state = int(self.query("RA"), 16)
-
-        return ToptekState(
-            bool(toptek_state & 0b0000000000000001),
-            bool(toptek_state & 0b0000000000000010),
-            bool(toptek_state & 0b0000000000000100),
-            bool(toptek_state & 0b0000000000001000),
-            bool(toptek_state & 0b0000000000010000),
-            bool(toptek_state & 0b0000000000100000),
-            bool(toptek_state & 0b0000000001000000),
-            bool(toptek_state & 0b0000000010000000),
-            bool(toptek_state & 0b0000000100000000),
-            bool(toptek_state & 0b0000001000000000),
-            bool(toptek_state & 0b0000010000000000),
-            bool(toptek_state & 0b0000100000000000),
-            bool(da_state),
+    def get_full_state(
+        self, use_cache: bool = True
+    ) -> tuple[ToptekState, ToptekSwitchState]:
+        """Read the current state of the LEDs and the buttons in one round-trip
+
+        The result is cached for STATE_CACHE_TTL seconds, or until a switch command is sent
+        """
+        if use_cache and self._state_cache is not None:
+            read_time, state, sw_state = self._state_cache
+            if time.monotonic() - read_time < self.STATE_CACHE_TTL:
+                return state, sw_state
+
+        self.write("RX")
+        return self._read_full_state()
+
+    def _read_full_state(
+        self, firmware_time: float = 0
+    ) -> tuple[ToptekState, ToptekSwitchState]:
+        """Read the state line that ends a command
+
+        The controller may hold the line back for up to firmware_time seconds
+        """
+        line = self.readline(
+            firmware_time * self.FIRMWARE_TIME_MARGIN + self.SERIAL_TIMEOUT
         )
+        try:
+            return self._parse_full_state(line)
+        except ValueError as err:
+            # Drop anything buffered so that a late reply isn't read as the next echo
+            self._rxbuf.clear()
+            self.ser.reset_input_buffer()
+            raise ToptekException(f"Invalid state from Toptek: {line!r}") from err
+
+    def _parse_full_state(self, line: str) -> tuple[ToptekState, ToptekSwitchState]:
+        """Parse a DA_SWR:SHIFT_STATE:DA_SWITCH:SWITCH_STATE line and cache the result"""
+        da_str, toptek_str, da_sw_str, toptek_sw_str = line.split(":")
+        da_state = int(da_str)
+        toptek_state = int(toptek_str, 16)
+        da_sw = int(da_sw_str)
+        toptek_sw = int(toptek_sw_str, 16)
+
+        state = ToptekState(toptek_state & _STATE_MASK, bool(da_state))
+        sw_state = ToptekSwitchState(
+            sw_ssb_on=bool(toptek_sw & _SW_SSB_ON),
+            sw_tx_pa=bool(toptek_sw & _SW_TX_PA),
+            sw_set_pwr=bool(toptek_sw & _SW_SET_PWR),
+            sw_rx_lna=bool(toptek_sw & _SW_RX_LNA),
+            sw_show_swr=bool(toptek_sw & _SW_SHOW_SWR),
+            sw_da_on=bool(da_sw),
+        )
+
+        self._state_cache = (time.monotonic(), state, sw_state)
+        return state, sw_state
 
-    def get_switch_state(self) -> ToptekSwitchState:
+    def get_state(self, use_cache: bool = True) -> ToptekState:
+        """Read the current state of the LEDs"""
+        return self.get_full_state(use_cache)[0]
+
+    def get_switch_state(self, use_cache: bool = True) -> ToptekSwitchState:
         """Read the current state of all buttons"""
-        da_sw = int(self.query("R6"))
-        toptek_sw = int(self.query("RS"), 16)
-        return ToptekSwitchState(
-            bool(toptek_sw & 0b00010000),
-            bool(toptek_sw & 0b00100000),
-            bool(toptek_sw & 0b00000100),
-            bool(toptek_sw & 0b00001000),
-            bool(toptek_sw & 0b00000001),
-            bool(da_sw),
-        )
+        return self.get_full_state(use_cache)[1]
 
     def info(self) -> str:
         """Returns a verbose string with basic state information"""
-        state = self.get_state()
-        sw_state = self.get_switch_state()
+        state, sw_state = self.get_full_state()
         outstr = "Toptek State: "
 
         if state.tx_pa:
@@ -307,51 +474,61 @@ class Toptek:
             return outstr
 
         if state.red_en:
-            outstr += f", ERRORS: {self.get_errors()}"
+            outstr += f", ERRORS: {self.get_errors(state)}"
             return outstr
 
-        outstr += f", output power set at {self.get_tx_power()}W"
+        outstr += f", output power set at {self.get_tx_power(state)}W"
 
         outstr += f", current power: {state.get_power()}"
 
         return outstr
 
-    def get_flashy_bargraph(self) -> ToptekState:
+    def get_flashy_bargraph(self, press: ToptekSwitches | None = None) -> ToptekState:
         """Helper for reading the LED bargraph while it's flashing
-        Polls the LED state until a valid state is found, and then waits until the
+        Waits for the controller to see a valid state, and then waits until the
             LEDs (should) stop blinking
-        """
-        state: ToptekState
-        for i in range(int(self.FLASHY_TOTAL_DELAY / self.FLASHY_POLL_DELAY)):
-            time.sleep(self.FLASHY_POLL_DELAY)
-            state = self.get_state()
-            if state.any_on() != 0:
-                time.sleep(self.FLASHY_TOTAL_DELAY - i * self.FLASHY_POLL_DELAY)
-                break
 
+        If press is given, that button is pressed in the same write as the read, and the
+            controller starts watching the bargraph once the press has been delivered
+        """
+        start = time.monotonic()
+        # The controller holds its response until the bargraph lights up, or it times out
+        if press is None:
+            window: float = self.FLASHY_TOTAL_DELAY
+            self.write("RB")
+        else:
+            # The PA's window starts once the press lands, which the controller waits for
+            # before watching the bargraph. Count from there so that a following press
+            # isn't taken as a step in the still-open setting mode.
+            window = self.PRESS_TIME + self.FLASHY_TOTAL_DELAY
+            self.bulk_write([f"P{int(press)}", "RB"])
+        state, _ = self._read_full_state(window)
+
+        time.sleep(max(0, window - (time.monotonic() - start)))
         return state
 
     #  ╭──────────────────────────────────────────────────────────╮
     #  │                      POWER HELPERS                       │
     #  ╰──────────────────────────────────────────────────────────╯
 
-    def get_errors(self) -> list[str]:
+    def get_errors(self, state: ToptekState | None = None) -> list[str]:
         """Get all errors"""
-        state = self.get_state()
+        if state is None:
+            state = self.get_state()
         if state.red_en is False:
             return [""]
 
         return self.get_flashy_bargraph().get_errors()
 
-    def get_tx_power(self) -> int:
+    def get_tx_power(self, state: ToptekState | None = None) -> int:
         """Get the power that the PA is set to"""
-        state = self.get_state()
+        if state is None:
+            state = self.get_state()
         if not state.tx_pa:
             # Can't get the tx power when PA off
             return 0
 
-        self.press(ToptekSwitches.SET_PWR)
-        return self.get_flashy_bargraph().get_power()
+        return self.get_flashy_bargraph(ToptekSwitches.SET_PWR).get_power()
 
     def set_tx_power(self, power: int) -> None:
         """Set the PA's power setting"""
@@ -364,7 +541,7 @@ class Toptek:
         if not state.tx_pa:
             raise ToptekException("Cannot set power when PA off!")
 
-        set_power = self.get_tx_power()
+        set_power = self.get_tx_power(state)
         if set_power < power:
             num_presses = int(abs(set_power - power) / 20)
         else:
@@ -373,24 +550,26 @@ class Toptek:
         if num_presses == 0:
             return
 
-        self.press(ToptekSwitches.SET_PWR)
-        time.sleep(0.1)
-
-        for _ in range(num_presses):
-            time.sleep(0.2)
-            self.press(ToptekSwitches.SET_PWR)
+        # One press to enter the power setting mode, then one per step. The controller spaces
+        # the presses out itself and replies once it's done.
+        self.write(f"M{num_presses + 1}")
+        self._read_full_state(
+            (num_presses + 1) * self.PRESS_TIME + num_presses * self.PRESS_SPACING
+        )
 
         # Timeout so we don't accidentally increment the power
         time.sleep(2)
-        actual_set = self.get_tx_power()
+        # Pressing SET_PWR doesn't change the PA state, so the first read still holds
+        actual_set = self.get_tx_power(state)
         if actual_set != power:
             raise ToptekException(
                 f"Power not set correctly (got {actual_set}, wanted {power})"
             )
 
-    def get_cur_power(self) -> int:
+    def get_cur_power(self, state: ToptekState | None = None) -> int:
         """Get the power that the PA is currently outputting"""
-        state = self.get_state()
+        if state is None:
+            state = self.get_state()
         if not state.tx_pa:
             raise ToptekException("Amplifier is not on!")
         if state.red_en:
@@ -402,102 +581,115 @@ class Toptek:
     #  │                      SWITCH HELPERS                      │
     #  ╰──────────────────────────────────────────────────────────╯
 
-    def pa_on(self, pa_delay=0.5) -> None:
+    def pa_on(self, pa_delay=0.5, state: ToptekState | None = None) -> None:
         """Turns the PA on"""
-        state = self.get_state()
+        if state is None:
+            state = self.get_state()
         if not state.tx_pa:
             logger.info("Turning PA on")
-            self.press(ToptekSwitches.TX_PA)
-            # sometimes the PA needs some extra time
-            time.sleep(pa_delay)
+            state = self.press_and_read(ToptekSwitches.TX_PA)
+            if not state.tx_pa:
+                # sometimes the PA needs some extra time
+                state = self._wait_for_led("tx_pa", True, pa_delay)
 
-            state = self.get_state()
             if not state.tx_pa:
                 raise ToptekException("PA not turned on")
         else:
             logger.info("PA already on")
 
-    def pa_off(self) -> None:
+    def pa_off(self, state: ToptekState | None = None) -> None:
         """Turns the PA off"""
-        state = self.get_state()
+        if state is None:
+            state = self.get_state()
         if state.tx_pa:
             logger.info("Turning PA off")
-            self.press(ToptekSwitches.TX_PA)
+            state = self.press_and_read(ToptekSwitches.TX_PA)
+            if state.tx_pa:
+                # sometimes the PA needs some extra time
+                state = self._wait_for_led("tx_pa", False, self.LED_OFF_DELAY)
 
-            state = self.get_state()
             if state.tx_pa:
                 raise ToptekException("PA not turned off")
         else:
             logger.info("PA already off")
 
-    def lna_on(self, lna_delay=0.5) -> None:
+    def lna_on(self, lna_delay=0.5, state: ToptekState | None = None) -> None:
         """Turns the LNA on"""
-        state = self.get_state()
+        if state is None:
+            state = self.get_state()
         if not state.lna_on:
             logger.info("Turning LNA on")
-            self.press(ToptekSwitches.RX_LNA)
-            # sometimes the LNA needs some extra time
-            time.sleep(lna_delay)
+            state = self.press_and_read(ToptekSwitches.RX_LNA)
+            if not state.lna_on:
+                # sometimes the LNA needs some extra time
+                state = self._wait_for_led("lna_on", True, lna_delay)
 
-            state = self.get_state()
             if not state.lna_on:
                 raise ToptekException("LNA not turned on")
         else:
             logger.info("LNA already on")
 
-    def lna_off(self) -> None:
+    def lna_off(self, state: ToptekState | None = None) -> None:
         """Turns the LNA off"""
-        state = self.get_state()
+        if state is None:
+            state = self.get_state()
         if state.lna_on:
             logger.info("Turning LNA off")
-            self.press(ToptekSwitches.RX_LNA)
+            state = self.press_and_read(ToptekSwitches.RX_LNA)
+            if state.lna_on:
+                # sometimes the LNA needs some extra time
+                state = self._wait_for_led("lna_on", False, self.LED_OFF_DELAY)
 
-            state = self.get_state()
             if state.lna_on:
                 raise ToptekException("LNA not turned off")
         else:
             logger.info("LNA already off")
 
-    def ssb_on(self, ssb_delay=0.5) -> None:
+    def ssb_on(self, ssb_delay=0.5, state: ToptekState | None = None) -> None:
         """Turns SSB mode on. Only can be set when the PA is on"""
-        state = self.get_state()
+        if state is None:
+            state = self.get_state()
         if not state.tx_pa:
             logger.warning("Cannot turn on SSB when PA not on")
             return
 
         if not state.ssb_on:
             logger.info("Turning SSB on")
-            self.press(ToptekSwitches.SSB_ON)
-            # sometimes the SSB needs some extra time
-            time.sleep(ssb_delay)
+            state = self.press_and_read(ToptekSwitches.SSB_ON)
+            if not state.ssb_on:
+                # sometimes the SSB needs some extra time
+                state = self._wait_for_led("ssb_on", True, ssb_delay)
 
-            state = self.get_state()
             if not state.ssb_on:
                 raise ToptekException("SSB not turned on")
 
         else:
             logger.info("SSB already on")
 
-    def ssb_off(self) -> None:
+    def ssb_off(self, state: ToptekState | None = None) -> None:
         """Turns the SSB mode off. Can only be unset when the PA is off"""
-        state = self.get_state()
+        if state is None:
+            state = self.get_state()
         if not state.tx_pa:
             logger.warning("Cannot turn off SSB when PA not on")
             return
 
         if state.ssb_on:
             logger.info("Turning SSB off")
-            self.press(ToptekSwitches.SSB_ON)
+            state = self.press_and_read(ToptekSwitches.SSB_ON)
+            if state.ssb_on:
+                # sometimes the SSB needs some extra time
+                state = self._wait_for_led("ssb_on", False, self.LED_OFF_DELAY)
 
-            state = self.get_state()
             if state.ssb_on:
                 raise ToptekException("SSB not turned off")
         else:
             logger.info("SSB already off")
 
-    def da_on(self) -> None:
+    def da_on(self, state: ToptekSwitchState | None = None) -> None:
         """Turns the DA on"""
-        state = self.get_switch_state()
+        if state is None:
+            state = self.get_switch_state()
         if not state.sw_da_on:
             logger.info("Turning DA on")
             self.switch_on(ToptekSwitches.DA_EN)
@@ -508,9 +700,10 @@ class Toptek:
         else:
             logger.info("DA already on")
 
-    def da_off(self) -> None:
+    def da_off(self, state: ToptekSwitchState | None = None) -> None:
         """Turns the DA off"""
-        state = self.get_switch_state()
+        if state is None:
+            state = self.get_switch_state()
         if state.sw_da_on:
             logger.info("Turning DA off")
             self.switch_off(ToptekSwitches.DA_EN)
@@ -40,6 +40,15 @@
 #define DA_EN_PORT_PIN  5 // for setting
 #define DA_SWR_PIN      4 // Connect to DA pin 5
 
+// Time until the PA's bargraph mode turns off
+#define BARGRAPH_TIMEOUT_MS 2000
+// Time for the PA to react to a button press
+#define PRESS_SETTLE_MS     100
+// Time for the ISR to deliver a single-shot press
+#define PRESS_TIMEOUT_MS    100
+// Extra time between repeated presses, so that the PA registers each one
+#define PRESS_SPACING_MS    200
+
 // Globals
 volatile uint8_t spi_buffer[2]  = {0};
 volatile bool spi_pos           = 0;
@@ -55,6 +64,11 @@ bool daSwitch                   = 0;
 bool daOverSWR                  = 0;
 
 void processCommand(char command, char target);
+void printFullState();
+void waitForBargraph();
+bool pressSwitch(char target);
+void waitForPress();
+void busyWaitMs(uint16_t ms);
 
 /*
  *  SPI ISR
@@ -184,6 +198,16 @@ void processCommand(char command, char target) {
             case 'W':
                 Serial.println(curSwitchState_buf, HEX);
                 break;
+            case 'X':
+                printFullState();
+                break;
+            case 'B':
+                // A press sent just before this (e.g. P3RB) must reach the PA first, or the
+                // bargraph may still show the output power rather than the set power
+                if (singleShotSwitch) waitForPress();
+                waitForBargraph();
+                printFullState();
+                break;
             case '1':
                 Serial.println(bitRead(curSwitchState_buf, SWITCH_SSB_ON), HEX);
                 break;
@@ -258,25 +282,23 @@ void processCommand(char command, char target) {
         }
         curSwitchState = curSwitchState_buf;
     } else if (command == 'P') {
-        switch (target) {
-            case '1':
-                bitSet(singleShotSwitch, SWITCH_SSB_ON);
-                break;
-            case '2':
-                bitSet(singleShotSwitch, SWITCH_TX_PA);
-                break;
-            case '3':
-                bitSet(singleShotSwitch, SWITCH_SET_PWR);
-                break;
-            case '4':
-                bitSet(singleShotSwitch, SWITCH_RX_LNA);
-                break;
-            case '5':
-                bitSet(singleShotSwitch, SWITCH_SHOW_SWR);
-                break;
-            default:
-                Serial.println("Unhandled statement");
+        if (!pressSwitch(target)) Serial.println("Unhandled statement");
+    } else if (command == 'Q') {
+        // Press, then report the state once the PA has reacted
+        if (pressSwitch(target)) {
+            waitForPress();
+            printFullState();
+        } else {
+            Serial.println("Unhandled statement");
         }
+    } else if (command == 'M' && target >= '1' && target <= '9') {
+        // Press SET_PWR several times, then report the final state
+        for (uint8_t i = 0; i < target - '0'; i++) {
+            if (i) busyWaitMs(PRESS_SPACING_MS);
+            pressSwitch('3');
+            waitForPress();
+        }
+        printFullState();
     } else if (command == 'E' && target == 'N') {
         pinMode(MATRIX_A_PIN, OUTPUT);
         pinMode(MATRIX_B_PIN, OUTPUT);
@@ -288,4 +310,76 @@ void processCommand(char command, char target) {
     } else {
         Serial.println("Unknown command");
     }
-}
\ No newline at end of file
+}
+
+/*
+ *  Prints the full state in one line, so the host only needs a single round-trip
+ *  Format is DA_SWR:SHIFT_STATE:DA_SWITCH:SWITCH_STATE
+ */
+void printFullState() {
+    uint16_t curShiftState_buf = curShiftState;
+    uint8_t curSwitchState_buf = curSwitchState;
+    Serial.print(daOverSWR, HEX);
+    Serial.print(':');
+    Serial.print(curShiftState_buf, HEX);
+    Serial.print(':');
+    Serial.print(daSwitch, HEX);
+    Serial.print(':');
+    Serial.println(curSwitchState_buf, HEX);
+}
+
+/*
+ *  Blocks until any of the bargraph LEDs are lit, or until BARGRAPH_TIMEOUT_MS has passed
+ *  Timer0 is disabled, so millis() can't be used here: count busy-waited milliseconds instead
+ */
+void waitForBargraph() {
+    for (uint16_t i = 0; i < BARGRAPH_TIMEOUT_MS; i++) {
+        if (curShiftState & 0x00FF) return;
+        delayMicroseconds(1000);
+    }
+}
+
+/*
+ *  Queues a single-shot press, which the ISR releases after one keyboard scan
+ *  Returns false if the target isn't a pressable switch
+ */
+bool pressSwitch(char target) {
+    switch (target) {
+        case '1':
+            bitSet(singleShotSwitch, SWITCH_SSB_ON);
+            return true;
+        case '2':
+            bitSet(singleShotSwitch, SWITCH_TX_PA);
+            return true;
+        case '3':
+            bitSet(singleShotSwitch, SWITCH_SET_PWR);
+            return true;
+        case '4':
+            bitSet(singleShotSwitch, SWITCH_RX_LNA);
+            return true;
+        case '5':
+            bitSet(singleShotSwitch, SWITCH_SHOW_SWR);
+            return true;
+        default:
+            return false;
+    }
+}
+
+/*
+ *  Blocks until the ISR has delivered the queued press, and then gives the PA time to react
+ */
+void waitForPress() {
+    for (uint16_t i = 0; i < PRESS_TIMEOUT_MS && singleShotSwitch; i++) {
+        delayMicroseconds(1000);
+    }
+    busyWaitMs(PRESS_SETTLE_MS);
+}
+
+/*
+ *  Timer0 is disabled, so delay() can't be used
+ */
+void busyWaitMs(uint16_t ms) {
+    for (uint16_t i = 0; i < ms; i++) {
+        delayMicroseconds(1000);
+    }
+}